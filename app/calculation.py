@@ -1,21 +1,90 @@
 from dataclasses import dataclass, field
 import datetime
+import functools
 from decimal import Decimal, InvalidOperation
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, ClassVar, Dict, Optional
 from app.exceptions import OperationError
+from app.operations import decimal_power, decimal_root
 
-@dataclass
+
+@functools.lru_cache(maxsize=32)
+def _quantize_template(precision: int) -> Decimal:
+    """
+    Return the Decimal exponent template used to round a result to the given precision.
+    """
+    return Decimal('0.' + '0' * precision)
+
+
+def _op_add(x: Decimal, y: Decimal) -> Decimal:
+    return x + y
+
+def _op_subtract(x: Decimal, y: Decimal) -> Decimal:
+    return x - y
+
+def _op_multiply(x: Decimal, y: Decimal) -> Decimal:
+    return x * y
+
+def _op_divide(x: Decimal, y: Decimal) -> Decimal:
+    return x / y if y != 0 else Calculation._raise_div_zero()
+
+def _op_power(x: Decimal, y: Decimal) -> Decimal:
+    return decimal_power(x, y) if y >= 0 else Calculation._raise_neg_power()
+
+def _op_root(x: Decimal, y: Decimal) -> Decimal:
+    if (x > 0 and y != 0) or (x == 0 and y > 0):
+        return decimal_root(x, y)
+    return Calculation._raise_invalid_root(x, y)
+
+def _op_modulus(x: Decimal, y: Decimal) -> Decimal:
+    return x % y if y != 0 else Calculation._raise_div_zero()
+
+def _op_int_divide(x: Decimal, y: Decimal) -> Decimal:
+    return x // y if y != 0 else Calculation._raise_div_zero()
+
+def _op_percent(x: Decimal, y: Decimal) -> Decimal:
+    return (x / y * 100) if y != 0 else Calculation._raise_div_zero()
+
+def _op_absolute_difference(x: Decimal, y: Decimal) -> Decimal:
+    return abs(x - y)
+
+@dataclass(slots=True)
 class Calculation:
     operation: str
     first_operand: Decimal
     second_operand: Decimal
 
-    result: Decimal = field(init=False)
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
+    # Precomputed result; keyword-only so the positional signature is unchanged
+    result: Optional[Decimal] = field(default=None, kw_only=True)
+
+    # String forms cached at construction for serialization
+    _first_str: str = field(init=False, repr=False, compare=False)
+    _second_str: str = field(init=False, repr=False, compare=False)
+    _result_str: str = field(init=False, repr=False, compare=False)
+    _timestamp_iso: str = field(init=False, repr=False, compare=False)
+
+    # Dispatch table built once at import instead of on every calculate() call.
+    _OPS: ClassVar[Dict[str, Callable[[Decimal, Decimal], Decimal]]] = {
+        "Addition": _op_add,
+        "Subtraction": _op_subtract,
+        "Multiplication": _op_multiply,
+        "Division": _op_divide,
+        "Power": _op_power,
+        "Root": _op_root,
+        "Modulus": _op_modulus,
+        "IntDivide": _op_int_divide,
+        "Percent": _op_percent,
+        "AbsoluteDifference": _op_absolute_difference
+    }
 
     def __post_init__(self):
-        self.result = self.calculate()
+        if self.result is None:
+            self.result = self.calculate()
+        self._first_str = str(self.first_operand)
+        self._second_str = str(self.second_operand)
+        self._result_str = str(self.result)
+        self._timestamp_iso = self.timestamp.isoformat()
 
     def calculate(self) -> Decimal:
         """
@@ -23,24 +92,7 @@ class Calculation:
         @return: The result of the calculation.
         @raises OperationError: If the operation is invalid or if an error occurs during calculation.
         """
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            ),
-            "Modulus": lambda x, y: x % y if y != 0 else self._raise_div_zero(),
-            "IntDivide": lambda x, y: x // y if y != 0 else self._raise_div_zero(),
-            "Percent": lambda x, y: (x / y * 100) if y != 0 else self._raise_div_zero(),
-            "AbsoluteDifference": lambda x, y: abs(x - y)
-        }
-
-        op = operations.get(self.operation)
+        op = Calculation._OPS.get(self.operation)
         if not op: 
             raise OperationError(f"Unknown operation: {self.operation}")
         
@@ -72,22 +124,26 @@ class Calculation:
             raise OperationError("Zero root is undefined")
         if x < 0:
             raise OperationError("Cannot calculate root of negative number")
+        if x == 0:
+            raise OperationError("Cannot calculate negative root of zero")
         raise OperationError("Invalid root operation") # pragma no cover
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'operation': self.operation,
-            'first_operand': str(self.first_operand),
-            'second_operand': str(self.second_operand),
-            'result': str(self.result),
-            'timestamp': self.timestamp.isoformat()
+            'first_operand': self._first_str,
+            'second_operand': self._second_str,
+            'result': self._result_str,
+            'timestamp': self._timestamp_iso
         }
     
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Calculation':
+    def from_dict(data: Dict[str, Any], verify: bool = True) -> 'Calculation':
         """
         Create a Calculation instance from a dictionary.
         @param data: Dictionary containing calculation data.
+        @param verify: Whether to recompute the result and warn if it differs from the saved one.
+        If False, the saved result is trusted and no arithmetic is performed.
         @return: A Calculation instance.
         @raises OperationError: If the data is invalid or missing required fields.
         """
@@ -95,15 +151,19 @@ class Calculation:
             calc = Calculation(
                 operation=data['operation'],
                 first_operand=Decimal(data['first_operand']),
-                second_operand=Decimal(data['second_operand'])
+                second_operand=Decimal(data['second_operand']),
+                result=None if verify else Decimal(data['result']),
+                timestamp=datetime.datetime.fromisoformat(data['timestamp'])
             )
 
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
-            saved_result = Decimal(data['result'])
-
-            if calc.result != saved_result:
+            # Compare the cached strings first; only differing strings need a numeric check
+            if (
+                verify
+                and calc._result_str != data['result']
+                and calc.result != Decimal(data['result'])
+            ):
                 logging.warning(
-                    f"Loaded calculation result {saved_result} "
+                    f"Loaded calculation result {data['result']} "
                     f"differs from computed result {calc.result}"
                 )
             
@@ -120,17 +180,15 @@ class Calculation:
             f"first_operand={self.first_operand}, "
             f"second_operand={self.second_operand}, "
             f"result={self.result}, "
-            f"timestamp='{self.timestamp.isoformat()}')"
+            f"timestamp='{self._timestamp_iso}')"
         )
     
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Calculation):
             return NotImplemented
         return (
-            self.operation == other.operation and
-            self.first_operand == other.first_operand and
-            self.second_operand == other.second_operand and
-            self.result == other.result
+            (self.operation, self.first_operand, self.second_operand, self.result) ==
+            (other.operation, other.first_operand, other.second_operand, other.result)
         )
     
     def format_result(self, precision: int = 10) -> str:
@@ -150,7 +208,7 @@ class Calculation:
             if self.operation == "IntDivide":
                 return str(int(self.result))
             return str(self.result.normalize().quantize(
-                Decimal('0.' + '0' * precision)
+                _quantize_template(precision)
             ).normalize())
         except InvalidOperation: # pragma no cover
             return str(self.result)
\ No newline at end of file
@@ -1,10 +1,10 @@
+from collections import deque
+import csv
 from decimal import Decimal
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Union
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
@@ -14,9 +14,14 @@ from app.history import HistoryObserver
 from app.input_validators import InputValidator
 from app.operations import Operation
 
+if TYPE_CHECKING: # pragma: no cover
+    import pandas as pd
+
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
+_HISTORY_COLUMNS = ['operation', 'first_operand', 'second_operand', 'result', 'timestamp']
+
 class Calculator:
     """
     Calculator class that performs arithmetic operations.
@@ -39,7 +44,11 @@ class Calculator:
         os.makedirs(self.config.log_dir, exist_ok=True)
         self._setup_logging()
 
-        self.history: List[Calculation] = []
+        # Bounded deque: appending past max_history_size evicts the oldest entry in O(1)
+        self.history: Deque[Calculation] = deque(maxlen=self.config.max_history_size)
+        # Number of leading history entries known to match the rows in the history file,
+        # or None when the file has to be rewritten on the next save
+        self._saved_count: Optional[int] = None
         self.operation_strategy: Optional[Operation] = None
         self.observers: List[HistoryObserver] = []
 
@@ -58,13 +67,12 @@ class Calculator:
         """
         Set up logging for the calculator.
         This method initializes the logging configuration based on the provided
-        configuration settings. It creates the log directory if it does not exist
-        and sets the logging level and format.
+        configuration settings. It sets the logging level and format; the log
+        directory is created beforehand in __init__.
         @raises Exception: If there is an error setting up logging.
         @return: None
         """
         try:
-            os.makedirs(self.config.log_dir, exist_ok=True)
             log_file = self.config.log_file.resolve()
 
             logging.basicConfig(
@@ -107,6 +115,8 @@ class Calculator:
         @param calculation: The Calculation object that has been performed.
         @return: None
         """
+        if not self.observers:
+            return
         for observer in self.observers:
             observer.update(calculation)
 
@@ -144,15 +154,17 @@ class Calculator:
             calculation = Calculation(
                 operation=str(self.operation_strategy),
                 first_operand=validated_a,
-                second_operand=validated_b
+                second_operand=validated_b,
+                result=result
             )
 
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
-            self.redo_stack.clear()
+            dropped = self.history[0] if len(self.history) == self.history.maxlen else None
             self.history.append(calculation)
+            if dropped is not None:
+                self._saved_count = None
 
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0) # pragma: no cover
+            self.undo_stack.append(CalculatorMemento(calculation=calculation, dropped=dropped))
+            self.redo_stack.clear()
             
             self.notify_observers(calculation)
             return result
@@ -166,30 +178,35 @@ class Calculator:
     def save_history(self) -> None:
         """
         Save the calculation history to a file.
-        This method creates the history directory if it does not exist,
-        and saves the history to a CSV file.
+        This method saves the history to a CSV file in the history directory
+        created by _setup_directories. When the rows already in the file are a
+        prefix of the history, only the new calculations are appended;
+        otherwise the whole file is rewritten.
         @raises OperationError: If there is an error saving the history.
         @return: None
         """
         try:
-            self.config.history_dir.mkdir(parents=True, exist_ok=True)
-            history_data = []
-            for calc in self.history:
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'first_operand': str(calc.first_operand),
-                    'second_operand': str(calc.second_operand),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-            
-            if history_data:
-                df = pd.DataFrame(history_data)
-                df.to_csv(self.config.history_file, index=False)
+            saved_count = self._saved_count
+            if saved_count is not None and saved_count <= len(self.history):
+                with open(
+                    self.config.history_file, 'a', newline='', encoding=self.config.default_encoding
+                ) as file:
+                    writer = csv.DictWriter(file, fieldnames=_HISTORY_COLUMNS)
+                    writer.writerows(
+                        self.history[i].to_dict() for i in range(saved_count, len(self.history))
+                    )
+            else:
+                with open(
+                    self.config.history_file, 'w', newline='', encoding=self.config.default_encoding
+                ) as file:
+                    writer = csv.DictWriter(file, fieldnames=_HISTORY_COLUMNS)
+                    writer.writeheader()
+                    writer.writerows(calc.to_dict() for calc in self.history)
+            self._saved_count = len(self.history)
+
+            if self.history:
                 logging.info(f"History saved successfully to {self.config.history_file}")
-            else: 
-                pd.DataFrame(columns=['operation', 'first_operand', 'second_operand', 'result', 'timestamp']
-                             ).to_csv(self.config.history_file, index=False)
+            else:
                 logging.info("Empty history saved")
         except Exception as e:
             logging.error(f"Failed to save history: {e}")
@@ -205,20 +222,23 @@ class Calculator:
         """
         try:
             if self.config.history_file.exists():
-                df = pd.read_csv(self.config.history_file)
-                if not df.empty:
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'first_operand': row['first_operand'],
-                            'second_operand': row['second_operand'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
+                with open(
+                    self.config.history_file, newline='', encoding=self.config.default_encoding
+                ) as file:
+                    history = [
+                        Calculation.from_dict(row, verify=False) for row in csv.DictReader(file)
                     ]
+                if history:
+                    self.history.clear()
+                    self.history.extend(history)
+                    # Entries beyond max_history_size were evicted, so the file no longer matches
+                    self._saved_count = len(history) if len(history) == len(self.history) else None
+                    # Mementos describe changes relative to the replaced history
+                    self.undo_stack.clear()
+                    self.redo_stack.clear()
                     logging.info(f"Loaded {len(self.history)} calculations from history")
                 else:
+                    self._saved_count = None
                     logging.info("Loaded empty history file")
             else:
                 logging.info("No history file found - starting with empty history")
@@ -226,7 +246,7 @@ class Calculator:
             logging.error(f"Failed to load history: {e}")
             raise OperationError(f"Failed to load history: {e}")
         
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def get_history_dataframe(self) -> 'pd.DataFrame':
         """
         Get the calculation history as a Pandas DataFrame.
         @return: A DataFrame containing the history of calculations.
@@ -235,28 +255,22 @@ class Calculator:
         @raises ValidationError: If the history is empty or invalid.
         @return: A Pandas DataFrame containing the history of calculations.
         """
-        history_data = []
-        for calc in self.history:
-            history_data.append({
-                'operation': str(calc.operation),
-                'first_operand': str(calc.first_operand),
-                'second_operand': str(calc.second_operand),
-                'result': str(calc.result),
-                'timestamp': calc.timestamp
-            })
-        return pd.DataFrame(history_data)
+        # pandas is slow to import and only needed here, so defer it to first use
+        import pandas as pd
+
+        # Reuse the strings cached by to_dict, keeping the timestamp as a datetime
+        history_data = [dict(calc.to_dict(), timestamp=calc.timestamp) for calc in self.history]
+        return pd.DataFrame(history_data, columns=_HISTORY_COLUMNS)
     
-    def show_history(self) -> List[str]:
+    def show_history(self) -> Iterator[str]:
         """
-        Show the calculation history as a list of strings.
-        @return: A list of strings representing the history of calculations.
-        This method formats each calculation in the history as a string
+        Show the calculation history as strings.
+        @return: An iterator of strings representing the history of calculations.
+        This method lazily formats each calculation in the history as a string
         in the format "operation(first_operand, second_operand) = result".
         """
-        return [
-            f"{calc.operation}({calc.first_operand}, {calc.second_operand}) = {calc.result}"
-            for calc in self.history
-        ]
+        for calc in self.history:
+            yield f"{calc.operation}({calc.first_operand}, {calc.second_operand}) = {calc.result}"
     
     def clear_history(self) -> None:
         """
@@ -267,30 +281,39 @@ class Calculator:
         self.history.clear()
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self._saved_count = None
         logging.info("History cleared")
 
     def undo(self) -> bool:
         """
         Undo the last calculation.
-        This method restores the previous state of the calculator from the undo stack.
+        This method reverts the change recorded by the latest memento on the undo stack.
         @return: True if the undo was successful, False otherwise.
         """
         if not self.undo_stack:
             return False
         memento = self.undo_stack.pop()
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        self.history = memento.history.copy()
+        self.history.pop()
+        if memento.dropped is not None:
+            self.history.appendleft(memento.dropped)
+        if memento.dropped is not None or (
+            self._saved_count is not None and self._saved_count > len(self.history)
+        ):
+            self._saved_count = None
+        self.redo_stack.append(memento)
         return True
     
     def redo(self) -> bool:
         """
         Redo the last undone calculation.
-        This method restores the next state of the calculator from the redo stack.
+        This method reapplies the change recorded by the latest memento on the redo stack.
         @return: True if the redo was successful, False otherwise.
         """
         if not self.redo_stack:
             return False
         memento = self.redo_stack.pop()
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        self.history = memento.history.copy()
+        self.history.append(memento.calculation)
+        if memento.dropped is not None:
+            self._saved_count = None
+        self.undo_stack.append(memento)
         return True
\ No newline at end of file
@@ -1,36 +1,42 @@
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 from app.calculation import Calculation
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorMemento:
     """
-    Memento class that stores the state of the calculator.
+    Memento class that stores a single change to the calculator history.
+    Instead of a full copy of the history, it records the calculation that was
+    appended and the oldest entry evicted by the history size limit, if any.
     """
-    history: List[Calculation]
+    calculation: Calculation
+    dropped: Optional[Calculation] = None
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
 
     """
     Convert the memento to a dictionary representation.
-    @return: A dictionary containing the history and timestamp.
+    @return: A dictionary containing the calculation, dropped entry and timestamp.
     This method is useful for serialization or saving the state to a file.
     """
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'history': [calc.to_dict() for calc in self.history],
+            'calculation': self.calculation.to_dict(),
+            'dropped': self.dropped.to_dict() if self.dropped is not None else None,
             'timestamp': self.timestamp.isoformat()
         }
-    
+
     """
     Create a CalculatorMemento instance from a dictionary representation.
-    @param data: A dictionary containing the history and timestamp.
+    @param data: A dictionary containing the calculation, dropped entry and timestamp.
     @return: A CalculatorMemento instance.
     """
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CalculatorMemento':
+        dropped = data.get('dropped')
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
+            calculation=Calculation.from_dict(data['calculation']),
+            dropped=Calculation.from_dict(dropped) if dropped is not None else None,
             timestamp=datetime.datetime.fromisoformat(data['timestamp'])
-        )
\ No newline at end of file
+        )
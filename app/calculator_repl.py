@@ -1,4 +1,5 @@
 from decimal import Decimal
+import itertools
 import logging
 from colorama import Style, Fore, init
 
@@ -9,111 +10,150 @@ from app.operations import OperationFactory
 
 init()
 
+_HELP_TEXT = (
+    Fore.YELLOW + "\n"
+    "Available commands:\n"
+    "  add, subtract, multiply, divide, power, root, modulus, int_divide, percent, abs_diff - Perform calculations\n"
+    "  history - Show calculation history\n"
+    "  clear - Clear calculation history\n"
+    "  undo - Undo the last calculation\n"
+    "  redo - Redo the last undone calculation\n"
+    "  save - Save calculation history to file\n"
+    "  load - Load calculation history from file\n"
+    "  exit - Exit the calculator" + Style.RESET_ALL
+)
+_MSG_HISTORY_CLEARED = Fore.RED + "History cleared" + Style.RESET_ALL
+_MSG_UNDONE = Fore.RED + "Operation undone" + Style.RESET_ALL
+_MSG_NOTHING_TO_UNDO = Fore.RED + "Nothing to undo" + Style.RESET_ALL
+_MSG_REDONE = Fore.RED + "Operation redone" + Style.RESET_ALL
+_MSG_NOTHING_TO_REDO = Fore.RED + "Nothing to redo" + Style.RESET_ALL
+_MSG_SAVED = Fore.GREEN + "History saved successfully" + Style.RESET_ALL
+_MSG_LOADED = Fore.GREEN + "History loaded successfully" + Style.RESET_ALL
+_MSG_CANCELLED = Fore.RED + "Operation cancelled" + Style.RESET_ALL
+
+"""
+Command handlers used by the REPL.
+Each handler receives the calculator and its auto-save observer,
+and returns True when the REPL should exit.
+"""
+def _cmd_help(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    print(_HELP_TEXT)
+    return False
+
+def _cmd_exit(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    try:
+        calc.save_history()
+        print(Fore.GREEN)
+        print("History saved successfully.")
+    except Exception as e: # pragma no cover
+        print(f"Warning: Could not save history: {e}")
+    print(Fore.GREEN)
+    print("Goodbye!")
+    return True
+
+def _cmd_history(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    history = calc.show_history()
+    first_entry = next(history, None)
+    if first_entry is None:
+        print("No calculations in history")
+    else:
+        print(Fore.MAGENTA +"\nCalculation History:")
+        for i, entry in enumerate(itertools.chain((first_entry,), history), 1):
+            print(Fore.CYAN + f"{i}. {entry}")
+        print(Style.RESET_ALL)
+    return False
+
+def _cmd_clear(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    calc.clear_history()
+    print(_MSG_HISTORY_CLEARED)
+    return False
+
+def _cmd_undo(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    print(_MSG_UNDONE if calc.undo() else _MSG_NOTHING_TO_UNDO)
+    return False
+
+def _cmd_redo(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    print(_MSG_REDONE if calc.redo() else _MSG_NOTHING_TO_REDO)
+    return False
+
+def _cmd_save(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    try:
+        calc.save_history()
+        print(_MSG_SAVED)
+    except Exception as e: # pragma: no cover
+        print(f"Error saving history: {e}")
+    return False
+
+def _cmd_load(calc: Calculator, auto_save_observer: AutoSaveObserver) -> bool:
+    try:
+        calc.load_history()
+        print(_MSG_LOADED)
+    except Exception as e: # pragma: no cover
+        print(f"Error loading history: {e}")
+    return False
+
+_COMMANDS = {
+    'help': _cmd_help,
+    'exit': _cmd_exit,
+    'history': _cmd_history,
+    'clear': _cmd_clear,
+    'undo': _cmd_undo,
+    'redo': _cmd_redo,
+    'save': _cmd_save,
+    'load': _cmd_load,
+}
+
+def _run_operation(calc: Calculator, command: str) -> None:
+    """
+    Prompt for two operands and perform the named operation.
+    @param calc: The calculator that performs the operation.
+    @param command: The registered name of the operation.
+    """
+    try:
+        print("Enter numbers (or 'cancel' to abort):")
+        a = input("First number: ")
+        if a.lower() == 'cancel':
+            print(_MSG_CANCELLED)
+            return
+        b = input("Second number: ")
+        if b.lower() == 'cancel':
+            print(_MSG_CANCELLED)
+            return
+        
+        operation = OperationFactory.create_operation(command)
+        calc.set_operation(operation)
+        result = calc.perform_operation(a, b)
+
+        if isinstance(result, Decimal):
+            result = result.normalize()
+
+        print(f"\nResult: {result}" + Style.RESET_ALL)
+    except (ValidationError, OperationError) as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
 def calculator_repl():
     try:
         calc = Calculator()
         calc.add_observer(LoggingObserver())
-        calc.add_observer(AutoSaveObserver(calc))
+        auto_save_observer = AutoSaveObserver(calc)
+        calc.add_observer(auto_save_observer)
+        operation_names = frozenset(OperationFactory.get_operations())
         print("Calculator started. Type 'help' for commands.")
 
         while True:
             try:
                 command = input("\nEnter command: ").lower().strip()
 
-                if command == 'help':
-                    print(Fore.YELLOW)
-                    print("Available commands:")
-                    print("  add, subtract, multiply, divide, power, root, modulus, int_divide, percent, abs_diff - Perform calculations")
-                    print("  history - Show calculation history")
-                    print("  clear - Clear calculation history")
-                    print("  undo - Undo the last calculation")
-                    print("  redo - Redo the last undone calculation")
-                    print("  save - Save calculation history to file")
-                    print("  load - Load calculation history from file")
-                    print("  exit - Exit the calculator" + Style.RESET_ALL)
-                    continue
-                
-                if command == 'exit':
-                    try:
-                        calc.save_history()
-                        print(Fore.GREEN)
-                        print("History saved successfully.")
-                    except Exception as e: # pragma no cover
-                        print(f"Warning: Could not save history: {e}")
-                    print(Fore.GREEN)
-                    print("Goodbye!")
-                    break
-
-                if command == 'history':
-                    history = calc.show_history()
-                    if not history:
-                        print("No calculations in history")
-                    else:
-                        print(Fore.MAGENTA +"\nCalculation History:")
-                        for i, entry in enumerate(history, 1):
-                            print(Fore.CYAN + f"{i}. {entry}")
-                        print(Style.RESET_ALL)
-                    continue
-
-                if command == 'clear':
-                    calc.clear_history()
-                    print(Fore.RED + "History cleared" + Style.RESET_ALL)
-                    continue
-
-                if command == 'undo':
-                    if calc.undo():
-                        print(Fore.RED + "Operation undone" + Style.RESET_ALL)
-                    else:
-                        print(Fore.RED + "Nothing to undo" + Style.RESET_ALL)
-                    continue
-
-                if command == 'redo':
-                    if calc.redo():
-                        print(Fore.RED + "Operation redone" + Style.RESET_ALL)
-                    else:
-                        print(Fore.RED + "Nothing to redo" + Style.RESET_ALL)
-                    continue
-            
-                if command == 'save':
-                    try:
-                        calc.save_history()
-                        print(Fore.GREEN + "History saved successfully" + Style.RESET_ALL)
-                    except Exception as e: # pragma: no cover
-                        print(f"Error saving history: {e}")
-                    continue
-
-                if command == 'load': 
-                    try:
-                        calc.load_history()
-                        print(Fore.GREEN + "History loaded successfully" + Style.RESET_ALL)
-                    except Exception as e: # pragma: no cover
-                        print(f"Error loading history: {e}")
+                handler = _COMMANDS.get(command)
+                if handler is not None:
+                    if handler(calc, auto_save_observer):
+                        break
                     continue
 
-                if command in OperationFactory.get_operations():
-                    try:
-                        print("Enter numbers (or 'cancel' to abort):")
-                        a = input("First number: ")
-                        if a.lower() == 'cancel':
-                            print(Fore.RED + "Operation cancelled" + Style.RESET_ALL)
-                            continue
-                        b = input("Second number: ")
-                        if b.lower() == 'cancel':
-                            print(Fore.RED + "Operation cancelled" + Style.RESET_ALL)
-                            continue
-                        
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-                        result = calc.perform_operation(a, b)
-
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-
-                        print(f"\nResult: {result}" + Style.RESET_ALL)
-                    except (ValidationError, OperationError) as e:
-                        print(f"Error: {e}")
-                    except Exception as e:
-                         print(f"Unexpected error: {e}")
+                if command in operation_names:
+                    _run_operation(calc, command)
                     continue
 
                 print(Style.BRIGHT + Fore.RED + f"Unknown command: '{command}'. Type 'help' for available commands.")
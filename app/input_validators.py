@@ -20,9 +20,19 @@ class InputValidator:
         @raises ValidationError: If the input is not a valid number or exceeds the maximum allowed value.
         """
         try:
-            if isinstance(value, str):
+            value_type = type(value)
+            if value_type is int:
+                # Bounds-check ints before paying for the Decimal conversion
+                if abs(value) > config.max_input_value:
+                    raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
+                return Decimal(value).normalize()
+            if value_type is Decimal:
+                number = value
+            elif isinstance(value, str):
                 value = value.strip()
-            number = Decimal(str(value))
+                number = Decimal(value)
+            else:
+                number = Decimal(str(value))
             if abs(number) > config.max_input_value:
                 raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
             return number.normalize()
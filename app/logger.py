@@ -8,16 +8,21 @@ class LoggingObserver(HistoryObserver):
     Observer that logs calculation events.
     This observer logs the details of each calculation performed.
     It is useful for debugging and tracking the history of calculations.
+    The message is formatted lazily and skipped entirely when INFO is disabled.
     @param Calculation: The Calculation object that is being observed.
     @raises AttributeError: If the Calculation is None.
     """
     def update(self, calculation: Calculation) -> None:
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         logging.info(
-            f"Calculation performed: {calculation.operation} "
-            f"({calculation.first_operand}, {calculation.second_operand}) = "
-            f"{calculation.result}"
+            "Calculation performed: %s (%s, %s) = %s",
+            calculation.operation,
+            calculation.first_operand,
+            calculation.second_operand,
+            calculation.result
         )
 
 class AutoSaveObserver(HistoryObserver):
@@ -44,4 +49,4 @@ class AutoSaveObserver(HistoryObserver):
             raise AttributeError("Calculation cannot be None")
         if self.calculator.config.auto_save:
             self.calculator.save_history()
-            logging.info("History auto-saved")
\ No newline at end of file
+            logging.info("History auto-saved")
@@ -1,13 +1,78 @@
-from abc import ABC, abstractmethod
-from decimal import Decimal
+from decimal import Decimal, getcontext
+import sys
 from typing import Dict, List
 from app.exceptions import ValidationError
 
-class Operation(ABC):
-    @abstractmethod
+# Shared Decimal constants so comparisons don't coerce an int on every call
+_D_ZERO = Decimal(0)
+_D_ONE = Decimal(1)
+_D_HUNDRED = Decimal(100)
+
+# Validation messages shared by execute and validate_operands
+_MSG_DIVISION_BY_ZERO = "Division by zero is not allowed"
+_MSG_NEGATIVE_EXPONENT = "Negative exponents not supported"
+_MSG_NEGATIVE_BASE = "Cannot calculate root of negative number"
+_MSG_ZERO_ROOT = "Zero root is undefined"
+_MSG_NEGATIVE_ROOT_OF_ZERO = "Cannot calculate negative root of zero"
+_MSG_MODULUS_BY_ZERO = "Modulus by zero is not allowed"
+_MSG_DIVIDE_BY_ZERO = "Divide by zero is not allowed"
+
+
+def normalize_result(number: Decimal) -> Decimal:
+    """
+    Round a computed result to the Decimal context and strip trailing zeros.
+    Integers that fit the precision keep their plain digits (1000, not 1E+3).
+    Shared by the Decimal operations and the batch evaluator in operations_fast.
+    """
+    number = number.normalize()
+    if number.is_finite() and number.as_tuple().exponent > 0 and number.adjusted() < getcontext().prec:
+        return number.quantize(_D_ONE)
+    return number
+
+
+def decimal_power(x: Decimal, y: Decimal) -> Decimal:
+    """
+    Raise x to the power of y; shared by Power and Calculation.
+    Integral exponents use Decimal's integer power; other exponents use Decimal's native power.
+    Results are rounded to the context precision, so large integral powers are not exact,
+    and are passed through normalize_result.
+    """
+    if y == y.to_integral_value():
+        # Decimal treats 0 ** 0 as invalid; match float pow, which returns 1
+        if y == _D_ZERO:
+            return _D_ONE
+        return normalize_result(x ** int(y))
+    return normalize_result(x ** y)
+
+
+def decimal_root(x: Decimal, y: Decimal) -> Decimal:
+    """
+    Calculate the y-th root of x; shared by Root and Calculation.
+    Square roots use Decimal.sqrt(); other degrees use Decimal's native power.
+    The result is passed through normalize_result.
+    """
+    if y == 2:
+        return normalize_result(x.sqrt())
+    return normalize_result(x ** (_D_ONE / y))
+
+class Operation:
+    __slots__ = ()
+
+    """
+    @param a: First operand.
+    @param b: Second operand.
+    @return: The result of the operation.
+    Subclasses must override this method.
+    @raises NotImplementedError: If the subclass does not implement execute.
+    """
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        pass # pragma: no cover
+        raise NotImplementedError
 
+    """
+    Validation hook that raises a ValidationError for invalid operands.
+    The default accepts any operands. Built-in operations with constraints override it;
+    their execute methods check inline and raise with the same _MSG_* messages.
+    """
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         pass
 
@@ -19,10 +84,11 @@ class Addition(Operation):
     @param a: First operand.
     @param b: Second operand.
     @return: The sum of a and b.
-    This method validates the operands and returns their sum.
+    This method returns the sum of a and b; any operands are valid.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
         return a + b
     
 class Subtraction(Operation):
@@ -30,10 +96,11 @@ class Subtraction(Operation):
     @param a: First operand.
     @param b: Second operand.
     @return: The difference of a and b.
-    This method validates the operands and returns their difference.
+    This method returns the difference of a and b; any operands are valid.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
         return a - b
     
 class Multiplication(Operation):
@@ -41,10 +108,11 @@ class Multiplication(Operation):
     @param a: First operand.
     @param b: Second operand.
     @return: The product of a and b.
-    This method validates the operands and returns their product.
+    This method returns the product of a and b; any operands are valid.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
         return a * b
 
 class Division(Operation):
@@ -54,130 +122,142 @@ class Division(Operation):
     @return: The quotient of a and b.
     This method validates the operands and returns their quotient.
     It raises a ValidationError if b is zero to prevent division by zero.
+    A zero numerator returns zero without performing the division.
     """
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if b == 0:
-            raise ValidationError("Division by zero is not allowed")
-        
-    """
-    @param a: First operand.
-    @param b: Second operand.
-    @return: The quotient of a and b.
-    This method executes the division operation after validating the operands.
-    """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVISION_BY_ZERO)
+        if a == _D_ZERO:
+            return _D_ZERO
         return a / b
 
+    def validate_operands(self, a: Decimal, b: Decimal) -> None:
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVISION_BY_ZERO)
+
 class Power(Operation):
     """
     @param a: Base operand.
     @param b: Exponent operand.
+    @return: The result of a raised to the power of b.
     This method validates the operands and returns a raised to the power of b.
     It raises a ValidationError if b is negative, as negative exponents are not supported.
-    """
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if b < 0:
-            raise ValidationError("Negative exponents not supported")
-    
-    """
-    @param a: Base operand.
-    @param b: Exponent operand.
-    @return: The result of a raised to the power of b.
-    This method executes the power operation after validating the operands.
-    It uses float conversion to handle large numbers and avoid overflow.
+    The result is rounded to the Decimal context precision; see decimal_power.
     It returns a Decimal result.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        if b < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_EXPONENT)
+        return decimal_power(a, b)
+
+    def validate_operands(self, a: Decimal, b: Decimal) -> None:
+        if b < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_EXPONENT)
     
 class Root(Operation):
-    """
-    This method validates the operands
-    It raises a ValidationError if a is negative or b is zero, as these cases are undefined.
-    """
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if a < 0:
-            raise ValidationError("Cannot calculate root of negative number")
-        if b == 0:
-            raise ValidationError("Zero root is undefined")
-        
     """
     @param a: The number to calculate the root of.
     @param b: The degree of the root.
     @return: The b-th root of a.
+    This method validates the operands and returns the b-th root of a.
+    It raises a ValidationError if a is negative, b is zero, or a is zero and b is negative,
+    as these cases are undefined.
+    The root itself is computed by decimal_root.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1 / float(b)))
+        if a < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_BASE)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_ZERO_ROOT)
+        if a == _D_ZERO and b < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_ROOT_OF_ZERO)
+        return decimal_root(a, b)
+
+    def validate_operands(self, a: Decimal, b: Decimal) -> None:
+        if a < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_BASE)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_ZERO_ROOT)
+        if a == _D_ZERO and b < _D_ZERO:
+            raise ValidationError(_MSG_NEGATIVE_ROOT_OF_ZERO)
         
 class Modulus(Operation):
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if b == 0:
-            raise ValidationError("Modulus by zero is not allowed")
-
     """
     @param a: First operand.
     @param b: Second operand.
     @return: The modulus of a by b.
     This method validates the operands and returns the modulus of a by b.
+    It raises a ValidationError if b is zero.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_MODULUS_BY_ZERO)
         return a % b
-    
-class IntDivide(Operation):
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if b == 0:
-            raise ValidationError("Divide by zero is not allowed")
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_MODULUS_BY_ZERO)
     
+class IntDivide(Operation):
     """
     @param a: First operand.
     @param b: Second operand.
     @return: The result of integer division of a by b.
     This method validates the operands and performs integer division.
+    It raises a ValidationError if b is zero.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVIDE_BY_ZERO)
         return a // b
+
+    def validate_operands(self, a: Decimal, b: Decimal) -> None:
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVIDE_BY_ZERO)
         
 class Percent(Operation):
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
-        if b == 0:
-            raise ValidationError("Divide by zero is not allowed")
-    
     """
     @param a: First operand.
     @param b: Second operand.
     @return: The percentage of a with respect to b.
     This method validates the operands and returns the percentage of a with respect to b.
     It raises a ValidationError if b is zero to prevent division by zero.
+    A zero numerator returns zero without performing the division.
     """
-    def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
-        return (a / b) * 100
+    __slots__ = ()
 
+    def execute(self, a: Decimal, b: Decimal) -> Decimal:
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVIDE_BY_ZERO)
+        if a == _D_ZERO:
+            return _D_ZERO
+        return (a / b) * _D_HUNDRED
 
-class AbsoluteDifference(Operation):
-    
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        super().validate_operands(a, b)
+        if b == _D_ZERO:
+            raise ValidationError(_MSG_DIVIDE_BY_ZERO)
+
 
+class AbsoluteDifference(Operation):
     """
     @param a: First operand.
     @param b: Second operand.
     @return: The absolute difference between a and b.
-    This method validates the operands and returns the absolute difference.
+    This method returns the absolute difference; any operands are valid.
     """
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
-        self.validate_operands(a, b)
         return abs(a - b)
 
 
@@ -186,7 +266,8 @@ class OperationFactory:
     Factory class to create operation instances.
     It supports registering new operations dynamically.
     """
-    _operations: Dict[str, type] = {
+    # Keys are interned so canonical lookups can match on identity
+    _operations: Dict[str, type] = {sys.intern(name): operation_class for name, operation_class in {
         'add': Addition,
         'subtract': Subtraction,
         'multiply': Multiplication,
@@ -197,7 +278,9 @@ class OperationFactory:
         'int_divide': IntDivide,
         'percent': Percent,
         'abs_diff': AbsoluteDifference
-    }
+    }.items()}
+    # Shared instances keyed by lowercase operation name
+    _instances: Dict[str, Operation] = {}
 
     """
     @param name: The name of the operation to register.
@@ -209,20 +292,33 @@ class OperationFactory:
     def register_operation(cls, name: str, operation_class: type) -> None:
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
-        cls._operations[name.lower()] = operation_class
+        name = sys.intern(name.lower())
+        cls._operations[name] = operation_class
+        cls._instances.pop(name, None)
 
     """
     @param operation_type: The type of the operation to create.
     @return: An instance of the requested operation.
     This method creates an instance of the requested operation type.
+    Operations are stateless, so instances are cached and shared between calls;
+    a cached name costs a single dict lookup.
     It raises a ValueError if the operation type is unknown.
     """
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
-        operation_class = cls._operations.get(operation_type.lower())
+        try:
+            return cls._instances[operation_type]
+        except KeyError:
+            pass
+        name = operation_type.lower()
+        operation = cls._instances.get(name)
+        if operation is not None:
+            return operation
+        operation_class = cls._operations.get(name)
         if not operation_class:
             raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        operation = cls._instances[sys.intern(name)] = operation_class()
+        return operation
     
     """
     @param cls: The class itself.
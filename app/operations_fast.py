@@ -0,0 +1,79 @@
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.operations import normalize_result
+
+# Operation codes for batch evaluation, keyed by OperationFactory name
+OP_CODES: Dict[str, int] = {
+    'add': 0,
+    'subtract': 1,
+    'multiply': 2,
+    'divide': 3,
+    'power': 4,
+    'root': 5,
+    'modulus': 6,
+    'int_divide': 7,
+    'percent': 8,
+    'abs_diff': 9
+}
+
+# Kernels indexed by operation code. Modulus and integer division truncate
+# toward zero so the results match Decimal's % and // operators.
+_KERNELS: List[Callable[[np.ndarray, np.ndarray], np.ndarray]] = [
+    np.add,
+    np.subtract,
+    np.multiply,
+    np.divide,
+    np.power,
+    lambda a, b: np.power(a, 1.0 / b),
+    np.fmod,
+    lambda a, b: np.trunc(a / b),
+    lambda a, b: a / b * 100,
+    lambda a, b: np.abs(a - b)
+]
+
+
+def eval_batch(op_codes: np.ndarray, a: np.ndarray, b: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Evaluate many operations at once in float64.
+    @param op_codes: Integer array of operation codes (see OP_CODES).
+    @param a: First operands.
+    @param b: Second operands.
+    @param out: Optional output array; allocated when omitted.
+    @return: The array of results.
+    Operands are not validated: invalid inputs such as a zero divisor yield inf or nan
+    instead of raising, so callers needing errors must use the Operation classes.
+    """
+    if out is None:
+        out = np.empty(len(op_codes), dtype=np.float64)
+    with np.errstate(all='ignore'):
+        for code, kernel in enumerate(_KERNELS):
+            mask = op_codes == code
+            if mask.any():
+                out[mask] = kernel(a[mask], b[mask])
+    return out
+
+
+def evaluate(operations: Sequence[str], a: Sequence[Decimal], b: Sequence[Decimal]) -> List[Decimal]:
+    """
+    Evaluate a batch of named operations on Decimal operands through eval_batch.
+    This is a standalone API for callers with many operations to run at once;
+    the REPL and Calculator keep the exact Decimal operations.
+    @param operations: Operation names as registered in OperationFactory.
+    @param a: First operands.
+    @param b: Second operands.
+    @return: The results converted back to Decimal.
+    It raises a ValueError if an operation has no batch kernel.
+    """
+    try:
+        op_codes = np.fromiter((OP_CODES[name.lower()] for name in operations), dtype=np.int8, count=len(operations))
+    except KeyError as e:
+        raise ValueError(f"Unknown operation: {e.args[0]}") from e
+    results = eval_batch(
+        op_codes,
+        np.array(a, dtype=np.float64),
+        np.array(b, dtype=np.float64)
+    )
+    return [normalize_result(Decimal(repr(value))) for value in results.tolist()]
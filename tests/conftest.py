@@ -0,0 +1,93 @@
+from collections import deque
+import io
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.calculator_config import CalculatorConfig
+from app.logger import AutoSaveObserver
+
+# Environment variables that override the config's file locations at access time
+_PATH_ENV_VARS = (
+    'CALCULATOR_LOG_DIR',
+    'CALCULATOR_LOG_FILE',
+    'CALCULATOR_HISTORY_DIR',
+    'CALCULATOR_HISTORY_FILE'
+)
+
+
+@pytest.fixture
+def repl_io(monkeypatch):
+    """
+    Replace builtins.input and redirect stdout for REPL tests.
+    @return: A function that takes the input sequence and returns the buffer the REPL prints into.
+    Exception classes or instances in the input sequence are raised instead of returned, and
+    EOFError is raised once the sequence is exhausted, which ends the REPL.
+    """
+    def _set(sequence):
+        pending = deque(sequence)
+        output = io.StringIO()
+
+        def _input(_=""):
+            if not pending:
+                raise EOFError
+            value = pending.popleft()
+            if isinstance(value, BaseException) or (isinstance(value, type) and issubclass(value, BaseException)):
+                raise value
+            return value
+
+        monkeypatch.setattr("builtins.input", _input)
+        # Patched here rather than at setup so pytest's own capture does not replace it
+        monkeypatch.setattr("sys.stdout", output)
+        return output
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def _cfg_cache(tmp_path_factory):
+    """
+    Build the default CalculatorConfig once per session, with base_dir in a temporary directory.
+    Its log and history paths only stay under base_dir while _patch_cfg clears _PATH_ENV_VARS.
+    """
+    return CalculatorConfig(base_dir=tmp_path_factory.mktemp("cfg"))
+
+
+@pytest.fixture(autouse=True)
+def _patch_cfg(request, monkeypatch, _cfg_cache):
+    """
+    Make calculators created without an explicit config reuse the cached config, and clear
+    the path environment variables (set by tests/test_config.py at import) so logs and
+    history are written under its temporary base_dir instead of the working directory.
+    Tests marked real_config keep the real CalculatorConfig class and environment.
+    """
+    if request.node.get_closest_marker("real_config") is None:
+        monkeypatch.setattr("app.calculator.CalculatorConfig", lambda *args, **kwargs: _cfg_cache)
+        for var in _PATH_ENV_VARS:
+            monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture(scope="session")
+def sample_calc():
+    """
+    A read-only calculation stand-in for observer tests.
+    """
+    return SimpleNamespace(operation="addition", first_operand=4, second_operand=3, result=7)
+
+
+@pytest.fixture
+def calculator_mock():
+    """
+    A minimal calculator stand-in for observer tests: an auto-save-enabled config
+    and a save_history Mock. AutoSaveObserver only reads config.auto_save and calls save_history.
+    """
+    return SimpleNamespace(config=SimpleNamespace(auto_save=True), save_history=Mock())
+
+
+@pytest.fixture
+def autosave_setup(calculator_mock):
+    """
+    @return: The calculator mock and an AutoSaveObserver attached to it.
+    """
+    return calculator_mock, AutoSaveObserver(calculator_mock)
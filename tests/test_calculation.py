@@ -66,6 +66,10 @@ def test_invalid_root():
      with pytest.raises(OperationError, match="Cannot calculate root of negative number"):
          calc = Calculation(operation="Root", first_operand=Decimal("-16"), second_operand=Decimal("2"))
 
+def test_negative_root_of_zero():
+    with pytest.raises(OperationError, match="Cannot calculate negative root of zero"):
+        Calculation(operation="Root", first_operand=Decimal("0"), second_operand=Decimal("-3"))
+
 def test_modulus_by_zero():
     with pytest.raises(OperationError, match="Division by zero is not allowed"):
         Calculation(operation="Modulus", first_operand=Decimal("10"), second_operand=Decimal("0"))
@@ -78,6 +82,12 @@ def test_unknown_operation():
     with pytest.raises(OperationError, match="Unknown operation"):
         Calculation(operation="Unknown", first_operand=Decimal("5"), second_operand=Decimal("3"))
 
+def test_precomputed_result_skips_calculation():
+    calc = Calculation(
+        operation="Unknown", first_operand=Decimal("2"), second_operand=Decimal("3"), result=Decimal("6")
+    )
+    assert calc.result == Decimal("6")
+
 def test_to_dict():
     calc = Calculation(operation="Addition", first_operand=Decimal("2"), second_operand=Decimal("3"))
     result_dict = calc.to_dict()
@@ -104,6 +114,16 @@ def test_from_dict():
     assert calc.second_operand == Decimal("3")
     assert calc.result == Decimal("5")
 
+def test_from_dict_to_dict_round_trip():
+    data = {
+        "operation": "Division",
+        "first_operand": "1",
+        "second_operand": "4",
+        "result": "0.25",
+        "timestamp": "2024-01-01T12:30:00.123456"
+    }
+    assert Calculation.from_dict(data).to_dict() == data
+
 def test_invalid_from_dict():
     data = {
         "operation": "Addition",
@@ -130,6 +150,13 @@ def test_equality():
     assert calc1 != calc3
 
 
+def test_positional_timestamp_argument():
+    timestamp = datetime(2024, 1, 1, 12, 0)
+    calc = Calculation("Addition", Decimal("1"), Decimal("2"), timestamp)
+    assert calc.timestamp == timestamp
+    assert calc.result == Decimal("3")
+
+
 def test_from_dict_result_mismatch(caplog):
     """
     Test the from_dict method to ensure it logs a warning when the saved result
@@ -145,6 +172,35 @@ def test_from_dict_result_mismatch(caplog):
 
     with caplog.at_level(logging.WARNING):
         calc = Calculation.from_dict(data)
+    assert "differs from computed result 5" in caplog.text
+
+def test_from_dict_numerically_equal_result_does_not_warn(caplog):
+    data = {
+        "operation": "Division",
+        "first_operand": "5",
+        "second_operand": "2",
+        "result": "2.50",
+        "timestamp": datetime.now().isoformat()
+    }
+
+    with caplog.at_level(logging.WARNING):
+        calc = Calculation.from_dict(data)
+    assert calc.result == Decimal("2.5")
+    assert "differs" not in caplog.text
+
+def test_from_dict_without_verify_trusts_saved_result(caplog):
+    data = {
+        "operation": "Addition",
+        "first_operand": "2",
+        "second_operand": "3",
+        "result": "10",
+        "timestamp": datetime.now().isoformat()
+    }
+
+    with caplog.at_level(logging.WARNING):
+        calc = Calculation.from_dict(data, verify=False)
+    assert calc.result == Decimal("10")
+    assert "differs" not in caplog.text
 
 def test_str_addition():
     calc = Calculation(operation="Addition", first_operand=Decimal("2"), second_operand=Decimal("3"))
@@ -257,3 +313,22 @@ def test_format_result_integer_division_label():
     assert calc.format_result() == "2"
 
 
+@pytest.mark.parametrize(
+    "operation, x, y, expected",
+    [
+        ("Power", Decimal("2"), Decimal("3"), "8"),
+        ("Power", Decimal("1E+1"), Decimal("3"), "1000"),
+        ("Power", Decimal("0"), Decimal("0"), "1"),
+        ("Power", Decimal("10"), Decimal("400"), "1E+400"),
+        ("Power", Decimal("4"), Decimal("0.5"), "2"),
+        ("Power", Decimal("1E+400"), Decimal("0.5"), "1E+200"),
+        ("Root", Decimal("16"), Decimal("2"), "4"),
+        ("Root", Decimal("27"), Decimal("3"), "3"),
+        ("Root", Decimal("8"), Decimal("-3"), "0.5"),
+        ("Root", Decimal("16"), Decimal("0.5"), "256"),
+    ]
+)
+def test_power_and_root_decimal(operation, x, y, expected):
+    calc = Calculation(operation=operation, first_operand=x, second_operand=y)
+    assert calc.result == Decimal(expected)
+    assert str(calc.result) == expected
@@ -1,3 +1,4 @@
+import csv
 import datetime
 from pathlib import Path
 import pandas as pd
@@ -34,19 +35,19 @@ def calculator():
             yield Calculator(config=config)
 
 def test_calculator_initialization(calculator):
-    assert calculator.history == []
+    assert list(calculator.history) == []
     assert calculator.undo_stack == []
     assert calculator.redo_stack == []
     assert calculator.operation_strategy is None
 
 @patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
+def test_logging_setup(logging_info_mock, tmp_path):
     with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
          patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
         mock_log_dir.return_value = Path('/tmp/logs')
         mock_log_file.return_value = Path('/tmp/logs/calculator.log')
         
-        calculator = Calculator(CalculatorConfig())
+        calculator = Calculator(CalculatorConfig(base_dir=tmp_path))
         logging_info_mock.assert_any_call("Calculator initialized with configuration")
 
 def test_add_observer(calculator):
@@ -66,6 +67,11 @@ def test_perform_operation_addition(calculator):
     result = calculator.perform_operation(2, 3)
     assert result == Decimal('5')
 
+def test_perform_operation_records_result(calculator):
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    result = calculator.perform_operation(2, '0.5')
+    assert calculator.history[-1].result == result
+
 def test_perform_operation_validation_error(calculator):
     calculator.set_operation(OperationFactory.create_operation('add'))
     with pytest.raises(ValidationError):
@@ -80,7 +86,7 @@ def test_undo(calculator):
     calculator.set_operation(operation)
     calculator.perform_operation(2,3)
     calculator.undo()
-    assert calculator.history == []
+    assert list(calculator.history) == []
 
 def test_redo(calculator):
     operation = OperationFactory.create_operation('add')
@@ -90,24 +96,95 @@ def test_redo(calculator):
     calculator.redo()
     assert len(calculator.history) == 1
 
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
+def test_undo_redo_restores_entry_dropped_by_history_limit(calculator):
+    calculator = Calculator(CalculatorConfig(base_dir=calculator.config.base_dir, max_history_size=2))
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for value in (1, 2, 3):
+        calculator.perform_operation(value, 0)
+    assert [calc.first_operand for calc in calculator.history] == [Decimal('2'), Decimal('3')]
+
+    calculator.undo()
+    assert [calc.first_operand for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+
+    calculator.redo()
+    assert [calc.first_operand for calc in calculator.history] == [Decimal('2'), Decimal('3')]
+
+def test_save_history(calculator):
     operation = OperationFactory.create_operation('add')
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.save_history()
-    mock_to_csv.assert_called_once()
-
-@patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
-    mock_read_csv.return_value = pd.DataFrame({
-        'operation': ['Addition'],
-        'first_operand': ['2'],
-        'second_operand': ['3'],
-        'result': ['5'],
-        'timestamp': [datetime.datetime.now().isoformat()]
-    })
+
+    df = pd.read_csv(
+        calculator.config.history_file, dtype=str, encoding=calculator.config.default_encoding
+    )
+    assert df.to_dict(orient='records') == [calculator.history[0].to_dict()]
+
+def _saved_rows(calculator):
+    with open(
+        calculator.config.history_file, newline='', encoding=calculator.config.default_encoding
+    ) as file:
+        return list(csv.DictReader(file))
+
+def test_save_history_keeps_file_in_sync_with_history(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    steps = [
+        lambda: calculator.perform_operation(1, 1),
+        lambda: calculator.perform_operation(2, 2),
+        calculator.undo,
+        calculator.redo,
+        calculator.undo,
+        lambda: calculator.perform_operation(3, 3),
+        calculator.clear_history,
+        lambda: calculator.perform_operation(4, 4),
+    ]
+    for step in steps:
+        step()
+        calculator.save_history()
+        assert _saved_rows(calculator) == [calc.to_dict() for calc in calculator.history]
+
+def test_save_history_rewrites_after_history_limit_eviction(calculator):
+    calculator = Calculator(CalculatorConfig(base_dir=calculator.config.base_dir, max_history_size=2))
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for value in (1, 2, 3):
+        calculator.perform_operation(value, 0)
+        calculator.save_history()
+    assert _saved_rows(calculator) == [calc.to_dict() for calc in calculator.history]
+
+    calculator.undo()
+    calculator.save_history()
+    calculator.redo()
+    calculator.save_history()
+    assert _saved_rows(calculator) == [calc.to_dict() for calc in calculator.history]
+
+def test_save_history_appends_only_new_rows(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.save_history()
+    calculator.perform_operation(2, 2)
+    with patch('builtins.open', wraps=open) as mock_open:
+        calculator.save_history()
+    assert mock_open.call_args[0][1] == 'a'
+    assert len(_saved_rows(calculator)) == 2
+
+def test_save_empty_history(calculator):
+    calculator.save_history()
+    df = pd.read_csv(calculator.config.history_file, encoding=calculator.config.default_encoding)
+    assert df.empty
+    assert list(df.columns) == ['operation', 'first_operand', 'second_operand', 'result', 'timestamp']
+
+def test_load_empty_history_file(calculator):
+    calculator.save_history()
+    calculator.load_history()
+    assert list(calculator.history) == []
+    assert calculator._saved_count is None
+
+def test_load_history(calculator):
+    calculator.config.history_file.write_text(
+        "operation,first_operand,second_operand,result,timestamp\n"
+        f"Addition,2,3,5,{datetime.datetime.now().isoformat()}\n",
+        encoding=calculator.config.default_encoding
+    )
 
     try:
         calculator.load_history()
@@ -120,36 +197,40 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
     except OperationError:
         pytest.fail("Loading history failed due to OperationError")
 
+def test_show_history(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    calculator.perform_operation(4, 5)
+    assert list(calculator.show_history()) == ["Addition(2, 3) = 5", "Addition(4, 5) = 9"]
+
 def test_clear_history(calculator):
     operation = OperationFactory.create_operation('add')
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
-    assert calculator.history == []
+    assert list(calculator.history) == []
     assert calculator.undo_stack == []
     assert calculator.redo_stack == []
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_calculator_repl_exit(mock_print, mock_input):
+def test_calculator_repl_exit(repl_io):
+    out = repl_io(['exit'])
     with patch('app.calculator.Calculator.save_history') as mock_save_history:
         calculator_repl()
         mock_save_history.assert_called_once()
-        mock_print.assert_any_call("History saved successfully.")
-        mock_print.assert_any_call("Goodbye!")
+    assert "History saved successfully.\n" in out.getvalue()
+    assert "Goodbye!\n" in out.getvalue()
 
-@patch('builtins.input', side_effect=['help','exit'])
-@patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
+def test_calculator_repl_help(repl_io):
+    out = repl_io(['help'])
     calculator_repl()
-    mock_print.assert_any_call("Available commands:")
+    assert "Available commands:" in out.getvalue()
 
-@patch('builtins.input', side_effect=['add', '3', '4', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
+def test_calculator_repl_addition(repl_io):
+    out = repl_io(['add', '3', '4'])
     calculator_repl()
-    mock_print.assert_any_call(f"\nResult: 7" + Style.RESET_ALL)
+    assert "\nResult: 7" + Style.RESET_ALL + "\n" in out.getvalue()
 
+@pytest.mark.real_config
 @patch('app.calculator.logging.warning')
 @patch('app.calculator.Calculator._setup_logging')
 @patch('app.calculator.CalculatorConfig.validate')
@@ -160,13 +241,14 @@ def test_calculator_init_load_history_exception(
     config = Mock(spec=CalculatorConfig)
     config.log_dir = Path('/tmp/logs')
     config.history_dir = Path('/tmp/history')
+    config.max_history_size = 1000
     with patch.object(Calculator, 'load_history', side_effect=Exception("history error")):
         Calculator(config=config)
         mock_logging_warning.assert_any_call("Could not load existing history: history error")
 
 
 def test_save_history_error(calculator):
-    with patch('app.calculator.pd.DataFrame.to_csv', side_effect=Exception("Save error")):
+    with patch('app.calculator.csv.DictWriter', side_effect=Exception("Save error")):
         with pytest.raises(OperationError, match="Failed to save history: Save error"):
             calculator.save_history()
 
@@ -183,8 +265,16 @@ def test_get_history_dataframe(calculator):
     assert 'second_operand' in df.columns
     assert 'result' in df.columns
     assert 'timestamp' in df.columns
+    assert df.iloc[0]['first_operand'] == '2'
+    assert df.iloc[0]['result'] == '5'
+    assert df.iloc[0]['timestamp'] == calculator.history[0].timestamp
+
+def test_get_history_dataframe_empty(calculator):
+    df = calculator.get_history_dataframe()
+    assert df.empty
+    assert list(df.columns) == ['operation', 'first_operand', 'second_operand', 'result', 'timestamp']
 
-def test_setup_logging_creates_log_dir_and_configures_logging():
+def test_setup_logging_configures_logging():
     config = MagicMock(spec=CalculatorConfig)
     config.log_dir = "/tmp/logs"
     config.log_file.resolve.return_value = "/tmp/logs/calculator.log"
@@ -196,7 +286,7 @@ def test_setup_logging_creates_log_dir_and_configures_logging():
             patch("app.calculator.logging.basicConfig") as mock_basicConfig, \
             patch("app.calculator.logging.info") as mock_logging_info:
         Calculator._setup_logging(calculator)
-        mock_makedirs.assert_called_once_with("/tmp/logs", exist_ok=True)
+        mock_makedirs.assert_not_called()
         mock_basicConfig.assert_called_once_with(
             filename="/tmp/logs/calculator.log",
             level=logging.INFO,
@@ -22,39 +22,40 @@ def calculation_patch(monkeypatch):
     monkeypatch.setattr(app.calculator_memento, "Calculation", DummyCalculation)
 
 def test_to_dict_and_from_dict(calculation_patch):
-    calc1 = DummyCalculation(10)
-    calc2 = DummyCalculation(20)
-    history = [calc1, calc2]
+    calc = DummyCalculation(10)
+    dropped = DummyCalculation(20)
     timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0)
-    memento = CalculatorMemento(history=history, timestamp=timestamp)
+    memento = CalculatorMemento(calculation=calc, dropped=dropped, timestamp=timestamp)
 
     memento_dict = memento.to_dict()
-    assert memento_dict['history'] == [{'value': 10}, {'value': 20}]
+    assert memento_dict['calculation'] == {'value': 10}
+    assert memento_dict['dropped'] == {'value': 20}
     assert memento_dict['timestamp'] == "2023-01-01T12:00:00"
 
     # Test from_dict
     restored = CalculatorMemento.from_dict(memento_dict)
     assert isinstance(restored, CalculatorMemento)
-    assert len(restored.history) == 2
-    assert all(isinstance(c, DummyCalculation) for c in restored.history)
-    assert restored.history[0].value == 10
-    assert restored.history[1].value == 20
+    assert isinstance(restored.calculation, DummyCalculation)
+    assert isinstance(restored.dropped, DummyCalculation)
+    assert restored.calculation.value == 10
+    assert restored.dropped.value == 20
     assert restored.timestamp == timestamp
 
-def test_to_dict_empty_history(calculation_patch):
+def test_to_dict_without_dropped(calculation_patch):
     timestamp = datetime.datetime(2022, 5, 5, 8, 30, 0)
-    memento = CalculatorMemento(history=[], timestamp=timestamp)
+    memento = CalculatorMemento(calculation=DummyCalculation(10), timestamp=timestamp)
     memento_dict = memento.to_dict()
-    assert memento_dict['history'] == []
+    assert memento_dict['dropped'] is None
     assert memento_dict['timestamp'] == "2022-05-05T08:30:00"
 
-def test_from_dict_empty_history(calculation_patch):
+def test_from_dict_without_dropped(calculation_patch):
     data = {
-        'history': [],
+        'calculation': {'value': 10},
+        'dropped': None,
         'timestamp': "2022-05-05T08:30:00"
     }
     memento = CalculatorMemento.from_dict(data)
     assert isinstance(memento, CalculatorMemento)
-    assert memento.history == []
+    assert memento.calculation.value == 10
+    assert memento.dropped is None
     assert memento.timestamp == datetime.datetime(2022, 5, 5, 8, 30, 0)
-
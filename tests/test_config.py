@@ -5,6 +5,9 @@ from pathlib import Path
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ConfigurationError
 
+# These tests read the CALCULATOR_* variables set below, which _patch_cfg clears otherwise
+pytestmark = pytest.mark.real_config
+
 os.environ['CALCULATOR_MAX_HISTORY_SIZE'] = '500'
 os.environ['CALCULATOR_AUTO_SAVE'] = 'false'
 os.environ['CALCULATOR_PRECISION'] = '8'
@@ -1,40 +1,23 @@
+import logging
 import pytest
-from unittest.mock import Mock, patch
-from app.calculation import Calculation
+from unittest.mock import Mock
 from app.logger import AutoSaveObserver
-from app.calculator import Calculator
-from app.calculator_config import CalculatorConfig
-
-calculation_mock = Mock(spec=Calculation)
-calculation_mock.operation = "addition"
-calculation_mock.first_operand = 4
-calculation_mock.second_operand = 3
-calculation_mock.result = 7
-
-def test_autosave_observer_triggers_save():
-    calculator_mock = Mock(spec=Calculator)
-    calculator_mock.config = Mock(spec=CalculatorConfig)
-    calculator_mock.config.auto_save = True
-    observer = AutoSaveObserver(calculator_mock)
-    
-    observer.update(calculation_mock)
+
+def test_autosave_observer_triggers_save(autosave_setup, sample_calc):
+    calculator_mock, observer = autosave_setup
+
+    observer.update(sample_calc)
     calculator_mock.save_history.assert_called_once()
 
-@patch('logging.info')
-def test_autosave_observer_logs_autosave(logging_info_mock):
-    calculator_mock = Mock(spec=Calculator)
-    calculator_mock.config = Mock(spec=CalculatorConfig)
-    calculator_mock.config.auto_save = True
-    observer = AutoSaveObserver(calculator_mock)
-    
-    observer.update(calculation_mock)
-    logging_info_mock.assert_called_once_with("History auto-saved")
-
-def test_autosave_observer_does_not_trigger_save_when_disabled():
-    calculator_mock = Mock(spec=Calculator)
-    calculator_mock.config = Mock(spec=CalculatorConfig)
-    calculator_mock.config.auto_save = True
-    observer = AutoSaveObserver(calculator_mock)
+def test_autosave_observer_logs_autosave(autosave_setup, caplog, sample_calc):
+    caplog.set_level(logging.INFO)
+    calculator_mock, observer = autosave_setup
+
+    observer.update(sample_calc)
+    assert "History auto-saved" in caplog.text
+
+def test_autosave_observer_does_not_trigger_save_when_disabled(autosave_setup):
+    calculator_mock, observer = autosave_setup
     with pytest.raises(AttributeError):
         observer.update(None)
 
@@ -44,3 +27,18 @@ def test_autosave_observer_init_missing_config():
     calculator_mock.save_history = Mock()
     with pytest.raises(TypeError):
         AutoSaveObserver(calculator_mock)
+
+def test_autosave_observer_skips_save_when_auto_save_off(autosave_setup, sample_calc):
+    calculator_mock, observer = autosave_setup
+    calculator_mock.config.auto_save = False
+
+    observer.update(sample_calc)
+    calculator_mock.save_history.assert_not_called()
+
+
+def test_autosave_observer_saves_on_every_update(autosave_setup, sample_calc):
+    calculator_mock, observer = autosave_setup
+
+    for _ in range(3):
+        observer.update(sample_calc)
+    assert calculator_mock.save_history.call_count == 3
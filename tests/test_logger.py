@@ -1,23 +1,22 @@
+import logging
 import pytest
-from unittest.mock import Mock, patch
-from app.calculation import Calculation
+from unittest.mock import patch
 from app.logger import LoggingObserver
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
 
-calculation_mock = Mock(spec=Calculation)
-calculation_mock.operation = "addition"
-calculation_mock.first_operand = 4
-calculation_mock.second_operand = 3
-calculation_mock.result = 7
+def test_logging_observer_logs_calculation(caplog, sample_calc):
+    caplog.set_level(logging.INFO)
+    observer = LoggingObserver()
+    observer.update(sample_calc)
+    assert "Calculation performed: addition (4, 3) = 7" in caplog.text
 
 @patch('logging.info')
-def test_logging_observer_logs_calculation(logging_info_mock):
+def test_logging_observer_skips_when_info_disabled(logging_info_mock, caplog, sample_calc):
+    caplog.set_level(logging.WARNING)
     observer = LoggingObserver()
-    observer.update(calculation_mock)
-    logging_info_mock.assert_called_once_with(
-        "Calculation performed: addition (4, 3) = 7"
-    )
+    observer.update(sample_calc)
+    logging_info_mock.assert_not_called()
 
 def test_logging_observer_no_calculation():
     observer = LoggingObserver()
@@ -1,3 +1,4 @@
+import sys
 import pytest
 from decimal import Decimal
 from typing import Any, Dict, Type
@@ -34,6 +35,21 @@ from app.operations import (
 def test_operation_inheritance(operation_class):
     assert issubclass(operation_class, Operation), f"{operation_class.__name__} must inherit from Operation"
 
+@pytest.mark.parametrize("operation_class", [
+    Addition,
+    Subtraction,
+    Multiplication,
+    Division,
+    Power,
+    Root,
+    Modulus,
+    IntDivide,
+    Percent,
+    AbsoluteDifference,
+])
+def test_operation_has_no_instance_dict(operation_class):
+    assert not hasattr(operation_class(), '__dict__'), f"{operation_class.__name__} must declare __slots__"
+
 class TestOperation:
     def test_str_representation(self):
         class TestOp(Operation):
@@ -42,6 +58,13 @@ class TestOperation:
         
         assert str(TestOp()) == "TestOp"
 
+    def test_execute_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            Operation().execute(Decimal("1"), Decimal("2"))
+
+    def test_default_validate_operands_accepts_any_operands(self):
+        assert Addition().validate_operands(Decimal("1"), Decimal("0")) is None
+
 class BaseOperationTest:
     operation_class: Type[Operation]
     valid_test_cases: Dict[str, Dict[str, Any]]
@@ -67,6 +90,14 @@ class BaseOperationTest:
             with pytest.raises(error, match=error_message):
                 operation.execute(a, b)
 
+    def test_validate_operands(self):
+        operation = self.operation_class()
+        for case in self.valid_test_cases.values():
+            operation.validate_operands(Decimal(str(case["a"])), Decimal(str(case["b"])))
+        for case in self.invalid_test_cases.values():
+            with pytest.raises(case.get("error", ValidationError), match=case.get("message", "")):
+                operation.validate_operands(Decimal(str(case["a"])), Decimal(str(case["b"])))
+
 class TestAddition(BaseOperationTest):
     operation_class = Addition
     valid_test_cases = {
@@ -143,6 +174,8 @@ class TestPower(BaseOperationTest):
         "one_exponent": {"a": "5", "b": "1", "expected": "5"},
         "decimal_base": {"a": "2.5", "b": "2", "expected": "6.25"},
         "zero_base": {"a": "0", "b": "5", "expected": "0"},
+        "fractional_exponent": {"a": "4", "b": "0.5", "expected": "2"},
+        "underflowing_exponent": {"a": "0.5", "b": "1E+8", "expected": "0"},
     }
     invalid_test_cases = {
         "negative_exponent": {
@@ -161,6 +194,8 @@ class TestRoot(BaseOperationTest):
         "cube_root": {"a": "27", "b": "3", "expected": "3"},
         "fourth_root": {"a": "16", "b": "4", "expected": "2"},
         "decimal_root": {"a": "2.25", "b": "2", "expected": "1.5"},
+        "zero_cube_root": {"a": "0", "b": "3", "expected": "0"},
+        "decimal_cube_root": {"a": "0.001", "b": "3", "expected": "0.1"},
     }
     invalid_test_cases = {
         "negative_base": {
@@ -175,8 +210,19 @@ class TestRoot(BaseOperationTest):
             "error": ValidationError,
             "message": "Zero root is undefined"
         },
+        "negative_root_of_zero": {
+            "a": "0",
+            "b": "-3",
+            "error": ValidationError,
+            "message": "Cannot calculate negative root of zero"
+        },
     }
 
+    def test_cube_root_below_float_range(self):
+        a = Decimal("1e-400")
+        result = Root().execute(a, Decimal("3"))
+        assert abs(result ** 3 - a) < Decimal("1e-425")
+
 class TestModulus(BaseOperationTest):
     operation_class = Modulus
     valid_test_cases = {
@@ -275,6 +321,25 @@ class TestOperationFactory:
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
 
+    def test_create_operation_returns_cached_instance(self):
+        assert OperationFactory.create_operation('add') is OperationFactory.create_operation('add')
+        assert OperationFactory.create_operation('ADD') is OperationFactory.create_operation('add')
+
+    def test_operation_names_are_interned(self):
+        name = ''.join(['ab', 's_diff'])
+        assert any(key is sys.intern(name) for key in OperationFactory._operations)
+
+    def test_register_operation_replaces_cached_instance(self):
+        class ReplacementAddition(Addition):
+            pass
+
+        OperationFactory.create_operation('add')
+        OperationFactory.register_operation('add', ReplacementAddition)
+        try:
+            assert isinstance(OperationFactory.create_operation('add'), ReplacementAddition)
+        finally:
+            OperationFactory.register_operation('add', Addition)
+
     def test_register_invalid_operation(self):
         class InvalidOperation:
             pass
@@ -0,0 +1,50 @@
+from decimal import Decimal
+import math
+
+import numpy as np
+import pytest
+
+from app.operations import OperationFactory
+from app.operations_fast import OP_CODES, eval_batch, evaluate
+
+
+@pytest.mark.parametrize("operation, a, b", [
+    ('add', '5', '3'),
+    ('subtract', '5', '3'),
+    ('multiply', '2.5', '4'),
+    ('divide', '7', '2'),
+    ('power', '2', '10'),
+    ('root', '16', '4'),
+    ('modulus', '-7', '3'),
+    ('int_divide', '-7', '2'),
+    ('percent', '25', '200'),
+    ('abs_diff', '3', '10'),
+])
+def test_evaluate_matches_operations(operation, a, b):
+    expected = OperationFactory.create_operation(operation).execute(Decimal(a), Decimal(b))
+    result = evaluate([operation], [Decimal(a)], [Decimal(b)])
+    assert result == [pytest.approx(expected)]
+
+def test_evaluate_mixed_batch():
+    result = evaluate(['add', 'MULTIPLY', 'add'], [Decimal('1'), Decimal('2'), Decimal('3')], [Decimal('1'), Decimal('3'), Decimal('4')])
+    assert [str(value) for value in result] == ['2', '6', '7']
+
+def test_evaluate_formats_like_decimal_operations():
+    result = evaluate(['divide', 'power'], [Decimal('7'), Decimal('2')], [Decimal('2'), Decimal('10')])
+    assert [str(value) for value in result] == ['3.5', '1024']
+
+def test_evaluate_keeps_non_finite_results():
+    result = evaluate(['divide', 'multiply'], [Decimal('1'), Decimal('1E+1')], [Decimal('0'), Decimal('1E+2')])
+    assert [str(value) for value in result] == ['Infinity', '1000']
+
+def test_evaluate_unknown_operation():
+    with pytest.raises(ValueError, match="Unknown operation: unknown"):
+        evaluate(['unknown'], [Decimal('1')], [Decimal('1')])
+
+def test_eval_batch_writes_into_out():
+    out = np.zeros(2)
+    codes = np.array([OP_CODES['subtract'], OP_CODES['divide']], dtype=np.int8)
+    result = eval_batch(codes, np.array([5.0, 1.0]), np.array([2.0, 0.0]), out)
+    assert result is out
+    assert out[0] == 3.0
+    assert math.isinf(out[1])
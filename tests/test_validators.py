@@ -38,6 +38,18 @@ def test_validate_number_zero():
 def test_validate_number_trimmed_string():
     assert InputValidator.validate_number("  456  ", config) == Decimal('456')
 
+def test_validate_number_string_trailing_zeros_normalized():
+    assert str(InputValidator.validate_number("1.50", config)) == "1.5"
+
+def test_validate_number_string_trailing_point_normalized():
+    assert str(InputValidator.validate_number("10.", config)) == "1E+1"
+    assert str(InputValidator.validate_number("-100.", config)) == "-1E+2"
+    assert str(InputValidator.validate_number("12.", config)) == "12"
+
+def test_validate_number_long_string_rounded_to_precision():
+    result = InputValidator.validate_number("0.1234567890123456789012345678901", config)
+    assert result == Decimal("0.1234567890123456789012345678901").normalize()
+
 # Negative test cases
 def test_validate_number_invalid_string():
     with pytest.raises(ValidationError, match="Invalid number format: abc"):
@@ -55,6 +67,18 @@ def test_validate_number_exceeds_negative_max_value():
     with pytest.raises(ValidationError, match="Value exceeds maximum allowed"):
         InputValidator.validate_number(-Decimal('1000001'), config)
 
+def test_validate_number_exceeds_max_value_integer():
+    with pytest.raises(ValidationError, match="Value exceeds maximum allowed"):
+        InputValidator.validate_number(-1000001, config)
+
+def test_validate_number_nan_float():
+    with pytest.raises(ValidationError, match="Invalid number format: nan"):
+        InputValidator.validate_number(float('nan'), config)
+
+def test_validate_number_bool():
+    with pytest.raises(ValidationError, match="Invalid number format: True"):
+        InputValidator.validate_number(True, config)
+
 def test_validate_number_empty_string():
     with pytest.raises(ValidationError, match="Invalid number format: "):
         InputValidator.validate_number("", config)
@@ -70,3 +94,10 @@ def test_validate_number_none_value():
 def test_validate_number_non_numeric_type():
     with pytest.raises(ValidationError, match="Invalid number format: "):
         InputValidator.validate_number([], config)
+
+def test_validate_number_respects_updated_max_value():
+    local_config = CalculatorConfig(max_input_value=Decimal('1000'))
+    InputValidator.validate_number("-500", local_config)
+    local_config.max_input_value = Decimal(100)
+    with pytest.raises(ValidationError, match="Value exceeds maximum allowed"):
+        InputValidator.validate_number("-500", local_config)